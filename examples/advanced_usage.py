@@ -1,6 +1,7 @@
 import os
 from dataclasses import dataclass
 
+import orjson
 from fastapi.exceptions import RequestValidationError
 from starlette.requests import Request
 from starlette.responses import JSONResponse
@@ -24,6 +25,27 @@ slackle = Slackle(config=config)
 slackle.add_plugin(FormatterPlugin)
 
 
+# Static parts of responses are built (and serialized) once at import time
+# instead of on every event.
+REPOSITORY_BLOCKS = [
+    {"type": "divider"},
+    {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": "If you are interested in this project, "
+            "feel free to check out the repository:",
+        },
+        "accessory": {
+            "type": "button",
+            "text": {"type": "plain_text", "text": "Github"},
+            "url": "https://github.com/hlee-ai/slackle",
+        },
+    },
+]
+NAME_REQUIRED_MESSAGE = orjson.dumps({"text": "Please provide a name."})
+
+
 @slackle.exception_handler(RequestValidationError)
 async def exception_handler(request: Request, exc: RequestValidationError):
     import json
@@ -88,20 +110,7 @@ async def on_message(slack: SlackClient, event: SlackEvent, channel_id: str, req
                         f"You sent a message in {get_channel_mention(channel_id)}.",
                     },
                 },
-                {"type": "divider"},
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": "If you are interested in this project, "
-                        "feel free to check out the repository:",
-                    },
-                    "accessory": {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "Github"},
-                        "url": "https://github.com/hlee-ai/slackle",
-                    },
-                },
+                *REPOSITORY_BLOCKS,
             ]
         ),
         channel_id,
@@ -111,8 +120,8 @@ async def on_message(slack: SlackClient, event: SlackEvent, channel_id: str, req
 @slackle.on_command("/hello")
 async def hello_command(slack: SlackClient, text: str, channel_id: str):
     if not text:
-        return slack.send_message(SlackMarkdown(text="Please provide a name."), channel_id)
-    return slack.send_message(
+        return await slack.send_message_raw(NAME_REQUIRED_MESSAGE, channel_id)
+    return await slack.send_message(
         SlackResponse(
             blocks=[
                 {
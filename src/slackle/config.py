@@ -20,6 +20,10 @@ class SlackleConfig:
     ignore_bot_events: bool = True
     ignore_retry_events: bool = False
 
+    # callback handlers run on this many worker tasks; a full queue answers 503
+    handler_workers: int = 8
+    handler_queue_size: int = 1000
+
     # for development purposes only
     debug: bool = False
     unsafe_turnoff_token_verification: bool = False
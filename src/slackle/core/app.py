@@ -2,7 +2,9 @@
 Slackle App
 """
 
+from collections import defaultdict
 from contextlib import contextmanager
+from functools import cached_property
 from typing import Any, Callable, List, Optional, Type
 
 from fastapi import FastAPI
@@ -10,7 +12,7 @@ from fastapi import FastAPI
 from slackle.config import SlackleConfig
 from slackle.core.plugin import SlacklePlugin
 
-from .dispatcher import HookDispatcher
+from .dispatcher import HookDispatcher, HookIndex
 from .slack.client import SlackClient
 from .slack.interface import SlackInterface
 
@@ -27,18 +29,18 @@ class Slackle(FastAPI):
         self._config: SlackleConfig = config or SlackleConfig()
 
         # inner engines
-        self._slack: SlackInterface = SlackInterface(self._config.app_token)
+        # (the slack interface and its routes are built lazily, see `_slack`)
         self._plugins: List[SlacklePlugin] = []
         self._plugin_attrs = {}
-        self._hook_dispatcher = HookDispatcher(self._plugins)
+        self._hook_index: HookIndex = defaultdict(list)
+        self._hook_dispatcher = HookDispatcher(self._hook_index)
+        # class-level names (FastAPI API, Slackle API) plugins must not shadow by accident
+        self._reserved_names = frozenset(dir(type(self)))
 
         # fastapi hooks
         self.add_event_handler("startup", self._on_startup)
         self.add_event_handler("shutdown", self._on_shutdown)
 
-        # initialize slack routes
-        self._attach_slack_routes()
-
     @property
     def config(self) -> SlackleConfig:
         return self._config
@@ -53,8 +55,7 @@ class Slackle(FastAPI):
 
     @property
     def hooks(self) -> HookDispatcher:
-        if not hasattr(self, "_hook_dispatcher"):
-            raise RuntimeError("Hooks are not available before startup.")
+        # always set in __init__; hooks registered by later plugins land in the shared index
         return self._hook_dispatcher
 
     def on_event(self, name: str):
@@ -72,19 +73,43 @@ class Slackle(FastAPI):
         yield
         self.__plugin_setup_mode = False
 
-    def _attach_slack_routes(self):
-        self.include_router(self._slack.get_payload_router(), prefix="/slack", tags=["slack"])
+    @cached_property
+    def _slack(self) -> SlackInterface:
+        """
+        Slack interface, created on first use together with its payload routes.
+        """
+        slack = SlackInterface(self._config.app_token)
+        self._attach_slack_routes(slack)
+        return slack
+
+    def _attach_slack_routes(self, slack: SlackInterface):
+        routes = self.router.routes
+        existing = len(routes)
+        self.include_router(slack.get_payload_router(), prefix="/slack", tags=["slack"])
+        # the interface may be created after user routes (at the latest on startup);
+        # move the slack endpoints first so a user catch-all cannot shadow them
+        added = routes[existing:]
+        del routes[existing:]
+        routes[:0] = added
 
     async def _on_startup(self):
-        # setup hook dispatcher
-        self._hook_dispatcher = HookDispatcher(self._plugins)
+        # touching `_slack` also makes sure the slack routes exist before serving
+        await self._slack.open_session()
+        self._slack.start_workers(self._config.handler_workers, self._config.handler_queue_size)
         self.__booted = True
         await self._hook_dispatcher.emit(self, "startup")
 
     async def _on_shutdown(self):
+        await self._slack.stop_workers()
         await self._hook_dispatcher.emit(self, "shutdown")
+        await self.slack.stop_batching()
+        await self._slack.close_session()
         self.__booted = False
 
+    def _is_taken(self, name: str) -> bool:
+        # plain set/dict probes: unlike hasattr, nothing is resolved or evaluated
+        return name in self._reserved_names or name in self.__dict__
+
     def list_plugins(self):
         return [plugin.__class__.__name__ for plugin in self._plugins]
 
@@ -93,7 +118,7 @@ class Slackle(FastAPI):
             raise RuntimeError("Cannot register plugin after app startup.")
         if not self.__plugin_setup_mode:
             raise RuntimeError("register_plugin_attribute can only be called during plugin setup.")
-        if hasattr(self, name) and not override:
+        if self._is_taken(name) and not override:
             raise AttributeError(f"Attribute '{name}' already exists in app.")
         setattr(self, name, value)
         self._plugin_attrs[name] = value
@@ -103,7 +128,7 @@ class Slackle(FastAPI):
             raise RuntimeError("Cannot register plugin method after app startup.")
         if not self.__plugin_setup_mode:
             raise RuntimeError("register_plugin_method can only be called during plugin setup.")
-        if hasattr(self, name) and not override:
+        if self._is_taken(name) and not override:
             raise AttributeError(f"Method '{name}' already exists in app.")
         setattr(self, name, method)
         self._plugin_attrs[name] = method
@@ -119,6 +144,9 @@ class Slackle(FastAPI):
             _plugin = plugin()
             _plugin.setup(self)
             self._plugins.append(_plugin)
+            for event, hooks in _plugin._event_hooks.items():
+                for hook in hooks:
+                    self._hook_index[event].append((hook, hook._slackle_is_coro))
 
 
 __all__ = ["Slackle"]
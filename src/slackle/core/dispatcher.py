@@ -1,6 +1,4 @@
-from typing import TYPE_CHECKING, List
-
-from slackle.core.plugin import SlacklePlugin
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
 
 if TYPE_CHECKING:
     from slackle.core.app import Slackle
@@ -9,13 +7,32 @@ if TYPE_CHECKING:
 #  Create a decorator to register hooks in the app itself.
 
 
+HookIndex = Dict[str, List[Tuple[Callable, bool]]]
+
+
 class HookDispatcher:
-    def __init__(self, plugins: List[SlacklePlugin]):
-        self._plugins = plugins
+    __slots__ = ("_index",)
 
-    async def emit(self, app: "Slackle", hook_name: str, **kwargs):
-        for plugin in self._plugins:
-            await plugin.dispatch(app, hook_name, **kwargs)
+    def __init__(self, index: HookIndex):
+        # event name -> [(bound hook, is coroutine function)], built by Slackle.add_plugin
+        self._index = index
 
+    def has(self, hook_name: str) -> bool:
+        """
+        Whether any plugin listens to `hook_name`; lets callers skip building emit kwargs.
+        """
+        return bool(self._index.get(hook_name))
 
-__all__ = ["HookDispatcher"]
+    async def emit(self, app: "Slackle", hook_name: str, **kwargs):
+        hooks = self._index.get(hook_name)
+        if not hooks:
+            # nobody listens to this hook
+            return
+        for hook, is_coro in hooks:
+            if is_coro:
+                await hook(app, **kwargs)
+            else:
+                hook(app, **kwargs)
+
+
+__all__ = ["HookDispatcher", "HookIndex"]
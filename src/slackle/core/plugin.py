@@ -1,6 +1,6 @@
 import asyncio
 from collections import defaultdict
-from typing import TYPE_CHECKING, Callable, Dict, List
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
 
 if TYPE_CHECKING:
     from slackle.core.app import Slackle
@@ -21,34 +21,54 @@ def on_slackle_event(event: str):
 
     def decorator(func):
         func._slackle_event = event
+        func._slackle_is_coro = asyncio.iscoroutinefunction(func)
         return func
 
     return decorator
 
 
 class SlacklePlugin:
+    __slots__ = ("_event_hooks",)
+
+    # event name -> hook method names, collected once per class in __init_subclass__
+    _event_hook_names: Dict[str, Tuple[str, ...]] = {}
+
     def __init__(self):
-        self._event_hooks: Dict[str, List[Callable]] = defaultdict(list)
+        self._event_hooks: Dict[str, Tuple[Callable, ...]] = {}
         self._collect_event_hooks()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        hook_names: Dict[str, List[str]] = defaultdict(list)
+        seen = set()
+        for klass in cls.__mro__:
+            if klass is object:
+                continue
+            for attr_name, attr in klass.__dict__.items():
+                # an override in a subclass shadows the hooks of its parents
+                if attr_name in seen:
+                    continue
+                seen.add(attr_name)
+                event = getattr(attr, "_slackle_event", None)
+                if event is not None and callable(attr):
+                    hook_names[event].append(attr_name)
+        cls._event_hook_names = {event: tuple(names) for event, names in hook_names.items()}
+
     @property
     def name(self) -> str:
         return self.__class__.__name__
 
     def _collect_event_hooks(self):
-        for attr_name in dir(self):
-            attr = getattr(self, attr_name)
-            if callable(attr) and hasattr(attr, "_slackle_event"):
-                event = getattr(attr, "_slackle_event")
-                if attr not in self._event_hooks[event]:
-                    self._event_hooks[event].append(attr)
+        for event, names in type(self)._event_hook_names.items():
+            self._event_hooks[event] = tuple(getattr(self, name) for name in names)
 
     async def dispatch(self, app: "Slackle", event: str, **kwargs):
-        for hook in self._event_hooks.get(event, []):
-            if asyncio.iscoroutinefunction(hook):
-                await hook(self, app, **kwargs)
+        for hook in self._event_hooks.get(event, ()):
+            # hooks are bound methods, they already carry `self`
+            if hook._slackle_is_coro:
+                await hook(app, **kwargs)
             else:
-                hook(self, app, **kwargs)
+                hook(app, **kwargs)
 
     def setup(self, app: "Slackle") -> None:
         """
@@ -1,4 +1,7 @@
-from typing import Any, Iterator, Protocol
+import inspect
+from typing import Any, FrozenSet, Iterable, Iterator, NamedTuple, Optional, Protocol, Tuple
+
+from slackle.core.slack.params import ResolvedGetters, compile_param_getters
 
 
 class SlackCallbackHandler(Protocol):
@@ -13,6 +16,7 @@ class SlackCallbackHandler(Protocol):
     - `app`: the Slackle app instance
     - `slack`: the SlackClient wrapper
     - `payload`: raw SlackPayload object
+    - `raw_payload`: the request payload as a dict, parsed once
     - `user_id`: the ID of the user who triggered the event
     - `channel_id`: the ID of the channel where the event occurred
     - `request`: the FastAPI request object
@@ -23,21 +27,65 @@ class SlackCallbackHandler(Protocol):
     async def __call__(self, **kwargs: Any) -> None: ...
 
 
+class HandlerEntry(NamedTuple):
+    """
+    A registered handler with everything dispatch needs, computed once at registration.
+    """
+
+    func: SlackCallbackHandler
+    # names of the keyword arguments to inject; None means the handler takes **kwargs
+    params: Optional[FrozenSet[str]]
+    # (name, getter) pairs resolving exactly those kwargs for the entry's handle type
+    getters: ResolvedGetters
+
+
+def _prepare_handler(func: SlackCallbackHandler, handle_type: str) -> HandlerEntry:
+    """
+    Inspect a handler once at registration. Nothing is written onto `func`,
+    so bound methods and other attribute-less callables can be registered.
+    """
+    parameters = inspect.signature(func).parameters.values()
+    if any(param.kind is inspect.Parameter.VAR_KEYWORD for param in parameters):
+        params = None
+    else:
+        params = frozenset(param.name for param in parameters)
+    return HandlerEntry(func, params, compile_param_getters(handle_type, params))
+
+
 class SlackCallback:
     """
     A class for managing Slack event callbacks.
     """
 
+    __slots__ = ("_events", "_commands", "_actions", "_registries", "_entries")
+
     def __init__(self):
-        self._callbacks: dict[str, SlackCallbackHandler] = {}
         self._events: dict[str, SlackCallbackHandler] = {}
         self._commands: dict[str, SlackCallbackHandler] = {}
         self._actions: dict[str, SlackCallbackHandler] = {}
         # TODO: add more callback types
 
+        # handle type (the prefix used in callback keys) -> per-kind registry
+        self._registries: dict[str, dict[str, SlackCallbackHandler]] = {
+            "events": self._events,
+            "command": self._commands,
+            "interactivity": self._actions,
+        }
+        # handle type -> name -> HandlerEntry, kept next to the plain handler dicts
+        self._entries: dict[str, dict[str, HandlerEntry]] = {
+            handle_type: {} for handle_type in self._registries
+        }
+
     @property
     def callbacks(self) -> dict[str, SlackCallbackHandler]:
-        return self._callbacks
+        """
+        All callbacks keyed by "type:name", built on demand for introspection.
+        """
+        return {
+            f"{handle_type}:{name}": func
+            for handle_type, registry in self._registries.items()
+            for name, func in registry.items()
+        }
 
     @property
     def events(self) -> dict[str, SlackCallbackHandler]:
@@ -52,68 +100,136 @@ class SlackCallback:
         return self._actions
 
     def __contains__(self, callback: str) -> bool:
-        return callback in self._callbacks
+        return self.get(callback) is not None
 
     def __getitem__(self, callback: str) -> SlackCallbackHandler:
-        handler = self._callbacks.get(callback)
+        handler = self.get(callback)
         if not handler:
             raise KeyError(f"No callback registered for '{callback}'")
         return handler
 
     def __iter__(self) -> Iterator[str]:
-        return iter(self._callbacks)
+        for handle_type, registry in self._registries.items():
+            for name in registry:
+                yield f"{handle_type}:{name}"
 
     def __len__(self) -> int:
-        return len(self._callbacks)
+        return sum(len(registry) for registry in self._registries.values())
 
     def __repr__(self):
-        return f"<Callback callbacks={list(self._callbacks.keys())}>"
+        return f"<Callback callbacks={list(self)}>"
 
     def __str__(self):
         return f"<Callback {len(self)} callbacks>"
 
     def get(self, callback: str) -> SlackCallbackHandler | None:
-        return self._callbacks.get(callback)
+        handle_type, _, name = callback.partition(":")
+        return self.lookup(handle_type, name)
 
     def has(self, callback: str) -> bool:
-        return callback in self._callbacks
+        return callback in self
+
+    def get_event(self, event_type: str) -> SlackCallbackHandler | None:
+        return self._events.get(event_type)
+
+    def get_command(self, command_name: str) -> SlackCallbackHandler | None:
+        return self._commands.get(command_name)
+
+    def get_action(self, action_id: str) -> SlackCallbackHandler | None:
+        return self._actions.get(action_id)
+
+    def lookup(self, handle_type: str, name: str) -> SlackCallbackHandler | None:
+        """
+        Look up a callback by handle type and name without building a "type:name" key.
+        """
+        registry = self._registries.get(handle_type)
+        if registry is None:
+            return None
+        return registry.get(name)
+
+    def lookup_entry(self, handle_type: str, name: str) -> HandlerEntry | None:
+        """
+        Look up a callback together with its precomputed dispatch metadata.
+        Handlers put straight into the registry dicts are inspected on first lookup.
+        """
+        func = self.lookup(handle_type, name)
+        if func is None:
+            return None
+        entries = self._entries[handle_type]
+        entry = entries.get(name)
+        if entry is None or entry.func is not func:
+            entry = entries[name] = _prepare_handler(func, handle_type)
+        return entry
+
+    def _store(self, handle_type: str, name: str, func: SlackCallbackHandler) -> None:
+        self._entries[handle_type][name] = _prepare_handler(func, handle_type)
+        self._registries[handle_type][name] = func
 
     def update_from(self, other: "SlackCallback"):
         """
         Update the current callback registry with another callback registry.
         """
-        self._callbacks.update(other._callbacks)
         self._events.update(other._events)
         self._commands.update(other._commands)
         self._actions.update(other._actions)
+        for handle_type, entries in other._entries.items():
+            self._entries[handle_type].update(entries)
 
     @classmethod
     def merge(cls, *callbacks: "SlackCallback") -> "SlackCallback":
         merged = cls()
-        for cb in callbacks:
-            merged.update_from(cb)
+        # one update per registry kind instead of four updates per merged callback;
+        # the dicts are filled in place so `_registries` keeps pointing at them
+        merged._events.update(item for cb in callbacks for item in cb._events.items())
+        merged._commands.update(item for cb in callbacks for item in cb._commands.items())
+        merged._actions.update(item for cb in callbacks for item in cb._actions.items())
+        for handle_type, entries in merged._entries.items():
+            entries.update(item for cb in callbacks for item in cb._entries[handle_type].items())
         return merged
 
+    def bulk_register(self, items: Iterable[Tuple[str, str, SlackCallbackHandler]]) -> None:
+        """
+        Register many callbacks at once, e.g. from a plugin's setup.
+
+        Example:
+            callback.bulk_register([
+                ("events", "app_mention", on_mention),
+                ("command", "/hello", hello_command),
+                ("interactivity", "button-action", button_action),
+            ])
+        """
+        pending: dict[str, dict[str, HandlerEntry]] = {
+            handle_type: {} for handle_type in self._registries
+        }
+        for handle_type, name, func in items:
+            if handle_type not in pending:
+                raise ValueError(f"Unsupported callback type '{handle_type}'")
+            pending[handle_type][name] = _prepare_handler(func, handle_type)
+
+        for handle_type, registered in pending.items():
+            if registered:
+                self._entries[handle_type].update(registered)
+                self._registries[handle_type].update(
+                    (name, entry.func) for name, entry in registered.items()
+                )
+
     def event(self, event_type: str):
         def decorator(func: SlackCallbackHandler):
-            self._callbacks[f"events:{event_type}"] = func
-            self._events[event_type] = func
+            self._store("events", event_type, func)
             return func
 
         return decorator
 
     def command(self, command_name: str):
         def decorator(func: SlackCallbackHandler):
-            self._callbacks[f"command:{command_name}"] = func
-            self._commands[command_name] = func
+            self._store("command", command_name, func)
             return func
 
         return decorator
 
     def action(self, action_id: str):
         def decorator(func: SlackCallbackHandler):
-            self._callbacks[f"interactivity:{action_id}"] = func
-            self._actions[action_id] = func
+            self._store("interactivity", action_id, func)
             return func
 
         return decorator
@@ -1,20 +1,198 @@
-from typing import Any, Dict, Optional
+import asyncio
+import logging
+import os
+import re
+from dataclasses import fields, replace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+import aiohttp
+import orjson
 from slack_sdk.errors import SlackApiError
 from slack_sdk.web.async_client import AsyncWebClient
 
 from slackle.types.response import SlackBlock, SlackMarkdown, SlackResponse
+from slackle.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+SlackMessage = str | SlackMarkdown | SlackBlock | SlackResponse
+
+# SlackResponse fields forwarded to chat.postMessage; unset (None) ones are left out
+_POST_MESSAGE_FIELDS = tuple(
+    field.name for field in fields(SlackResponse) if field.name != "channel"
+)
+# options that must match for batched messages to be merged into one post
+_MERGE_KEY_FIELDS = tuple(name for name in _POST_MESSAGE_FIELDS if name not in ("text", "blocks"))
+
+# exact message type -> SlackResponse builder, checked before any isinstance fallback
+_NORMALIZERS: Dict[type, Callable[[Any, Optional[str]], SlackResponse]] = {
+    SlackResponse: lambda message, channel: message,
+    str: lambda message, channel: SlackResponse(channel=channel, text=message),
+    SlackMarkdown: lambda message, channel: SlackResponse(channel=channel, text=message.text),
+    SlackBlock: lambda message, channel: SlackResponse(channel=channel, blocks=message.blocks),
+}
+
+# minimum seconds between two batched posts to the same channel (Slack allows ~1 msg/s)
+BATCH_INTERVAL = 1.0
+# chat.postMessage accepts at most 50 blocks and 40k characters of text per message
+SLACK_MAX_BLOCKS = 50
+SLACK_MAX_TEXT_LENGTH = 40_000
+# section blocks accept at most 3000 characters of text
+SLACK_MAX_SECTION_TEXT_LENGTH = 3000
+# how many times a batched post is retried after a `ratelimited` error
+RATE_LIMIT_MAX_RETRIES = 3
+
+# upper bound on Web API calls one client has in flight, to stay clear of 429s
+# (overridable per process with the SLACK_MAX_CONCURRENT_REQUESTS environment variable)
+DEFAULT_MAX_CONCURRENT_REQUESTS = 10
+
+# user profiles rarely change; `user_change`/`team_join` events evict stale entries
+USER_CACHE_SIZE = 10_000
+USER_CACHE_TTL = 3600
+CHANNEL_CACHE_SIZE = 4096
+CHANNEL_CACHE_TTL = 3600
+CHANNEL_NAME_CACHE_SIZE = 1024
+CHANNEL_NAME_CACHE_TTL = 3600
+# page size for conversations.list when resolving channel names
+CHANNEL_LIST_PAGE_SIZE = 1000
+
+# public/private channel, DM and group DM IDs, as opposed to channel names
+_CHANNEL_ID_PATTERN = re.compile(r"[CDG][A-Z0-9]+")
+
+# one connection pool for every SlackClient in the process; tokens stay per client
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+# clients currently attached to the shared session; the last one to detach closes it
+_shared_session_users = 0
+
+
+async def _discard_session(
+    session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """
+    Close a session left behind by another event loop.
+    """
+    if session.closed:
+        return
+    if loop is not None and loop.is_running():
+        # still serving in another thread: let that loop close its own session
+        asyncio.run_coroutine_threadsafe(session.close(), loop)
+        return
+    try:
+        await session.close()
+    except RuntimeError:
+        # its transports are closed, but the old loop never ran the close to completion
+        logger.debug("Stale Slack HTTP session closed without waiting on its loop")
+
+
+async def _acquire_shared_session() -> aiohttp.ClientSession:
+    """
+    Return the process-wide keep-alive session and count the caller as a user,
+    creating the session on first use. Must be called from a running event loop.
+    """
+    global _shared_session, _shared_session_loop, _shared_session_users
+    loop = asyncio.get_running_loop()
+    # a session belongs to the loop it was created on
+    if _shared_session is not None and _shared_session_loop is not loop:
+        stale, stale_loop = _shared_session, _shared_session_loop
+        _shared_session, _shared_session_loop, _shared_session_users = None, None, 0
+        await _discard_session(stale, stale_loop)
+    if _shared_session is None or _shared_session.closed:
+        _shared_session_loop = loop
+        _shared_session_users = 0
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=30,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True,
+            )
+        )
+    _shared_session_users += 1
+    return _shared_session
+
+
+async def _release_shared_session(session: aiohttp.ClientSession) -> None:
+    """
+    Drop one user of the shared session and close it once nobody is attached.
+    """
+    global _shared_session, _shared_session_loop, _shared_session_users
+    if session is not _shared_session:
+        # already replaced after a loop change; the replacement closed it
+        return
+    _shared_session_users -= 1
+    if _shared_session_users > 0:
+        return
+    _shared_session, _shared_session_loop, _shared_session_users = None, None, 0
+    if not session.closed:
+        await session.close()
 
 
 class SlackClient:
     def __init__(self, token: str):
         self.client = AsyncWebClient(token=token)
+        # per-channel queues of batched messages and the tasks draining them
+        self._outbox: Dict[str, asyncio.Queue] = {}
+        self._drain_tasks: Dict[str, asyncio.Task] = {}
+        self._user_cache: TTLCache[str, Dict[str, Any]] = TTLCache(
+            maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL
+        )
+        self._channel_cache: TTLCache[str, Dict[str, Any]] = TTLCache(
+            maxsize=CHANNEL_CACHE_SIZE, ttl=CHANNEL_CACHE_TTL
+        )
+        # channel name -> ID, filled while paging through conversations.list
+        self._channel_ids: TTLCache[str, str] = TTLCache(
+            maxsize=CHANNEL_NAME_CACHE_SIZE, ttl=CHANNEL_NAME_CACHE_TTL
+        )
+        # lookups currently in flight, shared by concurrent callers asking for the same ID
+        self._user_inflight: Dict[str, asyncio.Task] = {}
+        self._channel_inflight: Dict[str, asyncio.Task] = {}
+        self._channel_name_inflight: Dict[str, asyncio.Task] = {}
+        self.max_concurrent_requests = int(
+            os.getenv("SLACK_MAX_CONCURRENT_REQUESTS", DEFAULT_MAX_CONCURRENT_REQUESTS)
+        )
+        # created lazily: a semaphore binds to the loop it is used on
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        # the shared keep-alive session this client holds a reference to, if any
+        self._held_session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def _request_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_concurrent_requests)
+            self._slots_loop = loop
+        return self._slots
+
+    async def open_session(self) -> None:
+        """
+        Route this client's Web API calls through the shared keep-alive session.
+        """
+        if self._held_session is not None:
+            await self.close_session()
+        self._held_session = await _acquire_shared_session()
+        self.client.session = self._held_session
+
+    async def close_session(self) -> None:
+        """
+        Detach from the shared session; it is closed when its last client detaches.
+        """
+        session, self._held_session = self._held_session, None
+        self.client.session = None
+        if session is not None:
+            await _release_shared_session(session)
 
     def _normalize_response(
         self,
         message: str | SlackMarkdown | SlackBlock | SlackResponse,
         channel: Optional[str],
     ) -> SlackResponse:
+        normalize = _NORMALIZERS.get(type(message))
+        if normalize is not None:
+            return normalize(message, channel)
+
+        # subclasses of the supported types miss the exact-type table
         if isinstance(message, SlackResponse):
             return message
 
@@ -24,13 +202,96 @@ class SlackClient:
 
         return SlackResponse(channel=channel, text=text, blocks=blocks)
 
+    @staticmethod
+    async def _cached_lookup(
+        cache: TTLCache,
+        inflight: Dict[str, asyncio.Task],
+        key: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        task = inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            inflight[key] = task
+
+            def _store(done: asyncio.Task):
+                inflight.pop(key, None)
+                if not done.cancelled() and done.exception() is None:
+                    cache[key] = done.result()
+
+            task.add_done_callback(_store)
+        # shielded so one cancelled caller does not cancel the lookup for the others
+        return await asyncio.shield(task)
+
     async def get_user_info(self, user_id: str) -> Optional[Dict[str, Any]]:
-        response = await self.client.users_info(user=user_id)
-        return response.get("user", {})
+        async def fetch():
+            async with self._request_slots:
+                response = await self.client.users_info(user=user_id)
+            return response.get("user", {})
+
+        return await self._cached_lookup(self._user_cache, self._user_inflight, user_id, fetch)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """
+        Drop the cached profile of a user so the next lookup hits the API again.
+        """
+        self._user_cache.pop(user_id, None)
 
     async def get_channel_info(self, channel_id: str) -> Optional[Dict[str, Any]]:
-        response = await self.client.channels_info(channel=channel_id)
-        return response.get("channel", {})
+        async def fetch():
+            async with self._request_slots:
+                response = await self.client.channels_info(channel=channel_id)
+            return response.get("channel", {})
+
+        return await self._cached_lookup(
+            self._channel_cache, self._channel_inflight, channel_id, fetch
+        )
+
+    def invalidate_channel(self, channel_id: str) -> None:
+        """
+        Drop the cached info of a channel so the next lookup hits the API again.
+        """
+        self._channel_cache.pop(channel_id, None)
+        # a renamed channel must not keep resolving from its old name
+        for name in [
+            name for name in self._channel_ids if self._channel_ids.get(name) == channel_id
+        ]:
+            self._channel_ids.pop(name, None)
+
+    async def resolve_channel(self, name_or_id: str) -> str:
+        """
+        Resolve a channel name such as "#alerts" (or "alerts") to its ID.
+        IDs are returned as they are; names are looked up once and cached.
+        """
+        name = name_or_id.lstrip("#")
+        if name == name_or_id and _CHANNEL_ID_PATTERN.fullmatch(name):
+            return name
+
+        async def fetch():
+            cursor = None
+            while True:
+                async with self._request_slots:
+                    response = await self.client.conversations_list(
+                        cursor=cursor,
+                        limit=CHANNEL_LIST_PAGE_SIZE,
+                        exclude_archived=True,
+                        types="public_channel,private_channel",
+                    )
+                for channel in response.get("channels", []):
+                    self._channel_ids[channel["name"]] = channel["id"]
+                if name in self._channel_ids:
+                    return self._channel_ids[name]
+                cursor = (response.get("response_metadata") or {}).get("next_cursor")
+                if not cursor:
+                    raise ValueError(f"Channel '{name_or_id}' not found")
+
+        return await self._cached_lookup(
+            self._channel_ids, self._channel_name_inflight, name, fetch
+        )
 
     async def get_user_name(self, user_id: str) -> Optional[str]:
         user_info = await self.get_user_info(user_id)
@@ -53,39 +314,203 @@ class SlackClient:
             if not channel:
                 raise ValueError("Channel is required")
 
-            if not response.text and not response.blocks:
+            return await self._post_message(response, channel)
+        except SlackApiError as e:
+            logger.error("Error sending message to %s: %s", channel, e)
+            return None
+
+    async def _post_message(self, response: SlackResponse, channel: str) -> Dict[str, Any]:
+        blocks = response.blocks
+        if not blocks:
+            # plain text messages, the common case, need no block normalization
+            if not response.text:
                 raise ValueError("Either text or blocks must be provided")
+        else:
+            if isinstance(blocks, SlackBlock):
+                response.blocks = blocks = blocks.blocks
+            if not response.text and blocks:
+                # notification fallback for block-only messages
+                response.text = str(blocks)
 
-            if response.blocks and isinstance(response.blocks, SlackBlock):
-                response.blocks = response.blocks.blocks
-
-            if not response.text and len(response.blocks) > 0:
-                response.text = str(response.blocks)
-
-            response = await self.client.chat_postMessage(
-                channel=channel,
-                text=response.text,
-                blocks=response.blocks,
-                attachments=response.attachments,
-                response_type=response.response_type,
-                thread_ts=response.thread_ts,
-                reply_broadcast=response.reply_broadcast,
-                icon_emoji=response.icon_emoji,
-                icon_url=response.icon_url,
-                link_names=response.link_names,
-                mrkdwn=response.mrkdwn,
-                parse=response.parse,
-                unfurl_links=response.unfurl_links,
-                unfurl_media=response.unfurl_media,
-                username=response.username,
-                metadata=response.metadata,
-                as_user=response.as_user,
-            )
-            return response.data
-        except SlackApiError as e:
-            # TODO: if logging is enabled, log the error
-            print(f"[SlackClient] Error sending message: {e}")
+        kwargs = {
+            name: value
+            for name in _POST_MESSAGE_FIELDS
+            if (value := getattr(response, name)) is not None
+        }
+        async with self._request_slots:
+            api_response = await self.client.chat_postMessage(channel=channel, **kwargs)
+        return api_response.data
+
+    async def send_message_raw(self, payload: bytes, channel: str) -> Optional[Dict[str, Any]]:
+        """
+        Send a chat.postMessage body that was serialized ahead of time.
+
+        `payload` is a JSON object without a channel, typically built once at import time
+        (e.g. `orjson.dumps({"blocks": [...]})`); only the channel is spliced in per call,
+        skipping message normalization and JSON encoding entirely.
+        """
+        if not channel:
+            raise ValueError("Channel is required")
+        if not payload.startswith(b"{"):
+            raise ValueError("payload must be a JSON object")
+
+        rest = payload[1:]
+        separator = b"" if rest.lstrip().startswith(b"}") else b","
+        body = b'{"channel":' + orjson.dumps(channel) + separator + rest
+        data = await self._post_json("chat.postMessage", body)
+        if not data.get("ok"):
+            logger.error("Error sending message to %s: %s", channel, data.get("error"))
             return None
+        return data
+
+    async def _post_json(self, api_method: str, body: bytes) -> Dict[str, Any]:
+        url = f"{self.client.base_url}{api_method}"
+        headers = {
+            **self.client.headers,
+            "Authorization": f"Bearer {self.client.token}",
+            "Content-Type": "application/json;charset=utf-8",
+        }
+        timeout = aiohttp.ClientTimeout(total=self.client.timeout)
+
+        session = self.client.session
+        async with self._request_slots:
+            if session is not None and not session.closed:
+                async with session.post(url, data=body, headers=headers, timeout=timeout) as res:
+                    return orjson.loads(await res.read())
+
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.post(url, data=body, headers=headers) as res:
+                    return orjson.loads(await res.read())
+
+    async def send_message_batched(
+        self,
+        message: SlackMessage,
+        channel: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Send a message through the channel's outbox.
+
+        Each channel is flushed at most once per `BATCH_INTERVAL`; messages queued in the
+        meantime are merged into as few chat.postMessage calls as Slack's limits allow,
+        and every caller receives the result of the call that carried its message.
+        Posts rejected with `ratelimited` are retried after the advertised Retry-After.
+        """
+        if not channel:
+            raise ValueError("Channel is required")
+
+        future = asyncio.get_running_loop().create_future()
+        queue = self._outbox.get(channel)
+        if queue is None:
+            queue = self._outbox[channel] = asyncio.Queue()
+        queue.put_nowait((self._normalize_response(message, channel), future))
+
+        if channel not in self._drain_tasks:
+            self._drain_tasks[channel] = asyncio.create_task(self._drain(channel))
+        return await future
+
+    async def stop_batching(self) -> None:
+        """
+        Wait until every outbox has been flushed.
+        """
+        while self._drain_tasks:
+            await asyncio.gather(*self._drain_tasks.values(), return_exceptions=True)
+
+    async def _drain(self, channel: str):
+        loop = asyncio.get_running_loop()
+        queue = self._outbox[channel]
+        try:
+            last_flush = None
+            while not queue.empty():
+                if last_flush is not None:
+                    # throttle: messages arriving meanwhile pile up and get merged
+                    await asyncio.sleep(max(0.0, last_flush + BATCH_INTERVAL - loop.time()))
+
+                groups: List[List[Tuple[SlackResponse, asyncio.Future]]] = []
+                while not queue.empty():
+                    response, future = queue.get_nowait()
+                    if not groups or not self._can_merge(groups[-1], response):
+                        groups.append([])
+                    groups[-1].append((response, future))
+
+                for group in groups:
+                    await self._send_group(channel, group)
+                last_flush = loop.time()
+        finally:
+            # no await between the final empty() check and here, so nothing can slip in
+            del self._drain_tasks[channel]
+            del self._outbox[channel]
+
+    @staticmethod
+    def _block_list(response: SlackResponse) -> List[Dict[str, Any]]:
+        if isinstance(response.blocks, SlackBlock):
+            return response.blocks.blocks
+        if response.blocks:
+            return response.blocks
+        if response.text:
+            return [{"type": "section", "text": {"type": "mrkdwn", "text": response.text}}]
+        return []
+
+    def _can_merge(
+        self, group: List[Tuple[SlackResponse, asyncio.Future]], response: SlackResponse
+    ) -> bool:
+        first = group[0][0]
+        if response.attachments or first.attachments:
+            return False
+        # the merged post carries the first message's options, so they must all agree
+        if any(getattr(response, name) != getattr(first, name) for name in _MERGE_KEY_FIELDS):
+            return False
+        responses = [r for r, _ in group] + [response]
+        if any(r.blocks for r in responses):
+            # text-only messages become sections, whose text Slack caps
+            if any(
+                not r.blocks and r.text and len(r.text) > SLACK_MAX_SECTION_TEXT_LENGTH
+                for r in responses
+            ):
+                return False
+            if sum(len(self._block_list(r)) for r in responses) > SLACK_MAX_BLOCKS:
+                return False
+        # merged texts are joined with newlines
+        text_length = sum(len(r.text) + 1 for r in responses if r.text)
+        return text_length <= SLACK_MAX_TEXT_LENGTH
+
+    async def _send_group(
+        self, channel: str, group: List[Tuple[SlackResponse, asyncio.Future]]
+    ) -> None:
+        responses = [response for response, _ in group]
+        if len(responses) == 1:
+            merged = responses[0]
+        elif any(response.blocks for response in responses):
+            # once blocks are involved, plain text messages are carried as sections
+            merged = replace(
+                responses[0],
+                text="\n".join(r.text for r in responses if r.text) or None,
+                blocks=[block for r in responses for block in self._block_list(r)],
+            )
+        else:
+            merged = replace(responses[0], text="\n".join(r.text for r in responses if r.text))
+
+        try:
+            result = await self._post_message_with_retry(merged, channel)
+        except Exception as e:
+            for _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for _, future in group:
+                if not future.done():
+                    future.set_result(result)
+
+    async def _post_message_with_retry(
+        self, response: SlackResponse, channel: str
+    ) -> Optional[Dict[str, Any]]:
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            try:
+                return await self._post_message(response, channel)
+            except SlackApiError as e:
+                if e.response.get("error") != "ratelimited" or attempt == RATE_LIMIT_MAX_RETRIES:
+                    logger.error("Error sending message to %s: %s", channel, e)
+                    return None
+                await asyncio.sleep(float(e.response.headers.get("Retry-After", 1)))
 
     # TODO: Add more methods like send_block, update_message, delete_message, open_modal, etc.
     async def send_ephemeral(
@@ -1,10 +1,14 @@
+import asyncio
 import inspect
-from typing import TYPE_CHECKING, Annotated, Awaitable, Callable, Type
+import logging
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Type
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
-from pydantic import BaseModel
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
 
+from slackle.constants import SlackVerificationMode
 from slackle.core.slack.callback import SlackCallback
+from slackle.core.slack.params import HandleScope
 from slackle.dependencies import get_app
 from slackle.types.context import SlackleContext
 from slackle.types.payload import (
@@ -13,20 +17,46 @@ from slackle.types.payload import (
     SlackInteractionPayload,
     SlackPayload,
 )
+from slackle.utils.slack import verify_slack_signature
 
 if TYPE_CHECKING:
     from slackle.core.app import Slackle
 
+logger = logging.getLogger(__name__)
+
+# events that carry a fresh user profile, invalidating the client's user cache
+_USER_CHANGE_EVENTS = frozenset({"user_change", "team_join"})
+# events that make cached channel info or channel name lookups stale
+_CHANNEL_CHANGE_EVENTS = frozenset({"channel_rename", "channel_deleted", "channel_archive"})
+
+
+def _extract_action_id(payload: SlackInteractionPayload) -> str:
+    if payload.actions and payload.actions[0].action_id:
+        return payload.actions[0].action_id
+    return "unknown_action"
+
+
+# handle type -> how the callback name is read from its payload
+_EXTRACTORS: Dict[str, Callable[[SlackPayload], str]] = {
+    "events": lambda payload: payload.event.type,
+    "command": lambda payload: payload.command,
+    "interactivity": _extract_action_id,
+}
+
 
 class SlackPayloadHandler:
-    _ROUTES = [
-        ("events", SlackEventPayload),
-        ("command", SlackCommandPayload, True),
-        ("interactivity", SlackInteractionPayload, True),
-    ]
+    # handle type (the route's path segment) -> payload model parsing it
+    _PAYLOAD_TYPES: Dict[str, Type[SlackPayload]] = {
+        "events": SlackEventPayload,
+        "command": SlackCommandPayload,
+        "interactivity": SlackInteractionPayload,
+    }
 
     def __init__(self):
         self._callback_registry: SlackCallback = SlackCallback()
+        # handler jobs queued by the endpoint; None until workers are started
+        self._work_queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
         self.router = APIRouter()
         self._register_routes()
 
@@ -34,6 +64,41 @@ class SlackPayloadHandler:
     def callbacks(self) -> SlackCallback:
         return self._callback_registry
 
+    def start_workers(self, count: int, queue_size: int) -> None:
+        """
+        Run handlers on `count` worker tasks fed by a queue of at most `queue_size` jobs.
+        Until this is called, handlers run as FastAPI background tasks.
+        Must be called from a running event loop.
+        """
+        if self._workers:
+            return
+        self._work_queue = asyncio.Queue(maxsize=queue_size)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(count)]
+
+    async def stop_workers(self) -> None:
+        """
+        Wait for queued jobs to finish, then stop the workers.
+        """
+        if not self._workers:
+            return
+        await self._work_queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._work_queue, self._workers = None, []
+
+    async def _worker(self):
+        queue = self._work_queue
+        while True:
+            job = await queue.get()
+            try:
+                await self._handle(*job)
+            except Exception:
+                # keep the worker alive; plugins also see the error via the `slack.error` hook
+                logger.exception("Error handling %s:%s", job[0], job[1])
+            finally:
+                queue.task_done()
+
     async def _pre_handle(
         self,
         handle_type: str,
@@ -48,29 +113,31 @@ class SlackPayloadHandler:
         Pre-handle the request before passing it to the handler.
         This is where you can add custom logic before the handler is called.
         """
-        await app.hooks.emit(
-            app,
-            "slack.pre_handle",
-            handle_type=handle_type,
-            handle_name=handle_name,
-            request=request,
-            response=response,
-            payload=payload,
-            context=context,
-        )
+        if app.hooks.has("slack.pre_handle"):
+            await app.hooks.emit(
+                app,
+                "slack.pre_handle",
+                handle_type=handle_type,
+                handle_name=handle_name,
+                request=request,
+                response=response,
+                payload=payload,
+                context=context,
+            )
 
         if request.headers.get("X-Slack-Retry-Num") and app.config.ignore_retry_events:
             return context.skip("Ignoring retry events")
 
         if (
-            payload.token != app.config.verification_token
+            app.config.verification_mode == SlackVerificationMode.TOKEN
+            and payload.token != app.config.verification_token
             and not app.config.unsafe_turnoff_token_verification
         ):
             return context.skip("Ignoring invalid token")
 
         if handle_type == "events":
             event = payload.event
-            if event.user == app.config.app_user_id:
+            if event.user_id == app.config.app_user_id:
                 return context.skip("Ignoring self events")
 
             if app.config.ignore_bot_events:
@@ -96,16 +163,17 @@ class SlackPayloadHandler:
         Post-handle the request after the handler has been called.
         This is where you can add custom logic after the handler is called.
         """
-        await app.hooks.emit(
-            app,
-            "slack.post_handle",
-            handle_type=handle_type,
-            handle_name=handle_name,
-            request=request,
-            response=response,
-            payload=payload,
-            context=context,
-        )
+        if app.hooks.has("slack.post_handle"):
+            await app.hooks.emit(
+                app,
+                "slack.post_handle",
+                handle_type=handle_type,
+                handle_name=handle_name,
+                request=request,
+                response=response,
+                payload=payload,
+                context=context,
+            )
 
     async def _handle(
         self,
@@ -121,42 +189,16 @@ class SlackPayloadHandler:
         This is where you can add custom logic to handle the request.
         """
 
-        handler = self._callback_registry.get(f"{handle_type}:{handle_name}")
+        if handle_type == "events" and handle_name in _USER_CHANGE_EVENTS:
+            app.slack.invalidate_user(payload.event.user_id)
+        elif handle_type == "events" and handle_name in _CHANNEL_CHANGE_EVENTS:
+            app.slack.invalidate_channel(payload.event.channel_id)
+
+        entry = self._callback_registry.lookup_entry(handle_type, handle_name)
         context = SlackleContext()
-        if handler:
-            params = inspect.signature(handler).parameters
-            available_params = {
-                "app": app,
-                "payload": payload,
-                "slack": app.slack,
-                "request": request,
-                "response": response,
-                "context": context,
-            }
-            if handle_type == "events":
-                available_params["event"] = payload.event
-                available_params["event_type"] = payload.event.type
-                available_params["user_id"] = payload.event.user
-                available_params["channel_id"] = payload.event.channel
-
-            if handle_type == "command":
-                available_params["command"] = payload.command
-                available_params["text"] = payload.text
-
-            if handle_type == "interactivity":
-                available_params["action"] = payload.actions[0]
-
-            if hasattr(payload, "user_id"):
-                available_params["user_id"] = payload.user_id
-            if hasattr(payload, "user"):
-                available_params["user_id"] = payload.user.get("id")
-
-            if hasattr(payload, "channel_id"):
-                available_params["channel_id"] = payload.channel_id
-            if hasattr(payload, "channel"):
-                available_params["channel_id"] = payload.channel.get("id")
-
-            kwargs = {k: v for k, v in available_params.items() if k in params}
+        if entry:
+            scope = HandleScope(app, request, response, payload, context)
+            kwargs = {name: getter(scope) for name, getter in entry.getters}
             await self._pre_handle(
                 handle_type, handle_name, app, request, response, payload, context
             )
@@ -164,9 +206,13 @@ class SlackPayloadHandler:
             if context.is_skipped:
                 return
             try:
-                await handler(**kwargs)
+                # sync wrappers may still hand back a coroutine, so await whatever is awaitable
+                result = entry.func(**kwargs)
+                if inspect.isawaitable(result):
+                    await result
             except Exception as e:
-                await app.hooks.emit(app, "slack.error", error=e, context=context)
+                if app.hooks.has("slack.error"):
+                    await app.hooks.emit(app, "slack.error", error=e, context=context)
                 raise
 
             if context.is_skipped:
@@ -175,64 +221,73 @@ class SlackPayloadHandler:
                 handle_type, handle_name, app, request, response, payload, context
             )
         else:
-            await app.hooks.emit(app, "slack.unhandled", context=context)
-
-    def _create_handler(
-        self, handle_type: str, payload_type: Type[BaseModel], use_form: bool = False
-    ) -> Callable[
-        [Request, Response, SlackPayload, BackgroundTasks, "Slackle"],
-        Awaitable[Response],
-    ]:
-        async def payload_handler(
-            request: Request,
-            response: Response,
-            payload: (
-                Annotated[payload_type, Depends(payload_type.as_form)] if use_form else payload_type
-            ),
-            background_tasks: BackgroundTasks,
-            app: "Slackle" = Depends(get_app),
-        ):
-            if app.config.debug:
-                print(payload)
-            # if the payload is a SlackEventPayload and it has a challenge, return it
-            if isinstance(payload, SlackEventPayload) and payload.challenge:
-                return Response(content=payload.challenge, media_type="text/plain")
-            background_tasks.add_task(
-                self._handle,
-                handle_type,
-                self._extract_handle_name(handle_type, payload),
-                app,
-                request,
-                response,
-                payload,
-            )
-            return Response(status_code=status.HTTP_200_OK)
+            if app.hooks.has("slack.unhandled"):
+                await app.hooks.emit(app, "slack.unhandled", context=context)
+
+    async def _payload_handler(
+        self,
+        handle_type: str,
+        request: Request,
+        response: Response,
+        background_tasks: BackgroundTasks,
+        app: "Slackle" = Depends(get_app),
+    ) -> Response:
+        payload_type = self._PAYLOAD_TYPES.get(handle_type)
+        if payload_type is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+        if not await self._verify_signature(app, request):
+            return Response(status_code=status.HTTP_401_UNAUTHORIZED)
 
-        return payload_handler
+        # a body read for the signature is cached on the request and not read again here
+        payload = await payload_type.from_request(request)
+        if app.config.debug:
+            print(payload)
+        # if the payload is a SlackEventPayload and it has a challenge, return it
+        if isinstance(payload, SlackEventPayload) and payload.challenge:
+            return Response(content=payload.challenge, media_type="text/plain")
+        job = (handle_type, _EXTRACTORS[handle_type](payload), app, request, response, payload)
+        if self._work_queue is None:
+            background_tasks.add_task(self._handle, *job)
+        else:
+            try:
+                self._work_queue.put_nowait(job)
+            except asyncio.QueueFull:
+                # shed load; Slack retries the delivery later
+                return Response(status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+        return Response(status_code=status.HTTP_200_OK)
+
+    @staticmethod
+    async def _verify_signature(app: "Slackle", request: Request) -> bool:
+        config = app.config
+        if (
+            config.verification_mode != SlackVerificationMode.SIGNATURE
+            or config.unsafe_turnoff_token_verification
+        ):
+            return True
+        return verify_slack_signature(
+            await request.body(),
+            request.headers.get("X-Slack-Request-Timestamp"),
+            request.headers.get("X-Slack-Signature"),
+            config.signing_secret,
+        )
 
     def _register_routes(self):
         """
         Register the routes for the Slack payload handler.
+        Each payload kind gets its literal path, all bound to the one shared endpoint.
         """
-        for type_, model, *use_form in self._ROUTES:
+        for handle_type in self._PAYLOAD_TYPES:
+            # bound positionally, so handle_type is not exposed as a query parameter
             self.router.add_api_route(
-                f"/{type_}",
-                self._create_handler(type_, model, *(use_form or [False])),
-                methods=["POST"],
+                f"/{handle_type}", partial(self._payload_handler, handle_type), methods=["POST"]
             )
 
     def _extract_handle_name(self, handle_type: str, payload: SlackPayload) -> str:
-        match handle_type:
-            case "events":
-                return payload.event.type
-            case "command":
-                return payload.command
-            case "interactivity":
-                if payload.actions and len(payload.actions) > 0:
-                    return payload.actions[0].get("action_id", "unknown_action")
-                return "unknown_action"
-            case _:
-                raise ValueError("Unsupported handle_type")
+        extract = _EXTRACTORS.get(handle_type)
+        if extract is None:
+            raise ValueError("Unsupported handle_type")
+        return extract(payload)
 
     def include_callback(self, callback: SlackCallback) -> None:
         """
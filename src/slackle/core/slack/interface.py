@@ -34,6 +34,31 @@ class SlackInterface:
         self._client = SlackClient(self.token)
         self._handler = SlackPayloadHandler()
 
+    async def open_session(self):
+        """
+        Attach the client to the process-wide keep-alive HTTP session.
+        Must be called from a running event loop (the app does it on startup).
+        """
+        await self._client.open_session()
+
+    async def close_session(self):
+        """
+        Detach the client from the shared HTTP session, closing it if no other client uses it.
+        """
+        await self._client.close_session()
+
+    def start_workers(self, count: int, queue_size: int):
+        """
+        Start the worker tasks that run callback handlers off the request path.
+        """
+        self._handler.start_workers(count, queue_size)
+
+    async def stop_workers(self):
+        """
+        Drain the handler queue and stop its workers.
+        """
+        await self._handler.stop_workers()
+
     def include_callback(self, callback: SlackCallback):
         """
         Include a callbacks to the Slack payload handler.
@@ -0,0 +1,76 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from fastapi import Request, Response
+
+from slackle.types.context import SlackleContext
+from slackle.types.payload import SlackPayload
+
+if TYPE_CHECKING:
+    from slackle.core.app import Slackle
+
+
+class HandleScope(NamedTuple):
+    app: "Slackle"
+    request: Request
+    response: Response
+    payload: SlackPayload
+    context: SlackleContext
+
+
+ParamGetter = Callable[[HandleScope], Any]
+
+# injectable handler kwargs, resolved only when a handler declares them
+_COMMON_PARAM_GETTERS: Dict[str, ParamGetter] = {
+    "app": lambda scope: scope.app,
+    "payload": lambda scope: scope.payload,
+    "slack": lambda scope: scope.app.slack,
+    "request": lambda scope: scope.request,
+    "response": lambda scope: scope.response,
+    "context": lambda scope: scope.context,
+    "raw_payload": lambda scope: getattr(scope.request.state, "slack_payload", None),
+}
+
+PARAM_GETTERS: Dict[str, Dict[str, ParamGetter]] = {
+    "events": {
+        **_COMMON_PARAM_GETTERS,
+        "event": lambda scope: scope.payload.event,
+        "event_type": lambda scope: scope.payload.event.type,
+        "user_id": lambda scope: scope.payload.event.user_id,
+        "channel_id": lambda scope: scope.payload.event.channel_id,
+    },
+    "command": {
+        **_COMMON_PARAM_GETTERS,
+        "command": lambda scope: scope.payload.command,
+        "text": lambda scope: scope.payload.text,
+        "user_id": lambda scope: scope.payload.user_id,
+        "channel_id": lambda scope: scope.payload.channel_id,
+    },
+    "interactivity": {
+        **_COMMON_PARAM_GETTERS,
+        "action": lambda scope: scope.payload.actions[0] if scope.payload.actions else None,
+        "user_id": lambda scope: (scope.payload.user or {}).get("id"),
+        "channel_id": lambda scope: (scope.payload.channel or {}).get("id"),
+    },
+}
+
+ResolvedGetters = Tuple[Tuple[str, ParamGetter], ...]
+
+
+def compile_param_getters(handle_type: str, params: Optional[FrozenSet[str]]) -> ResolvedGetters:
+    """
+    Pick the getters a handler needs for one handle type, once at registration.
+    `params` of None (a handler taking **kwargs) selects every getter.
+    """
+    getters = PARAM_GETTERS[handle_type]
+    if params is None:
+        return tuple(getters.items())
+    return tuple((name, getter) for name, getter in getters.items() if name in params)
+
+
+__all__ = [
+    "HandleScope",
+    "ParamGetter",
+    "PARAM_GETTERS",
+    "ResolvedGetters",
+    "compile_param_getters",
+]
@@ -4,6 +4,8 @@ class SlackleContext:
     This context will be used to store the state of the app.
     """
 
+    __slots__ = ("_context", "_skip", "_skip_reason")
+
     def __init__(self, **kwargs):
         self._context = kwargs
         self._skip = False
@@ -15,13 +17,13 @@ class SlackleContext:
         raise AttributeError(f"{item} not found in context")
 
     def __setattr__(self, key, value):
-        if key in ["_context", "_skip"]:
+        if key in self.__slots__:
             super().__setattr__(key, value)
         else:
             self._context[key] = value
 
     def __delattr__(self, item):
-        if item in ["_context", "_skip"]:
+        if item in self.__slots__:
             super().__delattr__(item)
         else:
             del self._context[item]
@@ -1,16 +1,86 @@
-import json
 from typing import Annotated, Any, Dict, List, Optional
 
-from fastapi import Form
-from pydantic import BaseModel
+import orjson
+from fastapi import Form, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ConfigDict, ValidationError
+
+
+def _parse_json(data: bytes | str) -> Dict[str, Any]:
+    """
+    Parse a Slack JSON document once, reporting errors the way FastAPI does for bodies.
+    """
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body", e.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": e.msg},
+                }
+            ],
+            body=data,
+        )
+
+
+def _validate(model: type[BaseModel], payload_dict: Dict[str, Any]):
+    try:
+        return model.model_validate(payload_dict)
+    except ValidationError as e:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        raise RequestValidationError(errors, body=payload_dict)
+
+
+class SlackAction(BaseModel):
+    # element-specific fields (selected_option, selected_users, ...) are kept as extras
+    model_config = ConfigDict(extra="allow")
+
+    action_id: Optional[str] = None
+    block_id: Optional[str] = None
+    type: Optional[str] = None
+    value: Optional[str] = None
+    action_ts: Optional[str] = None
+
+    def __getitem__(self, key: str) -> Any:
+        """
+        Dict-style access, for handlers written against the raw action dict.
+        Only payload keys are visible: declared fields and extras, never model methods.
+        """
+        if key in type(self).model_fields:
+            return getattr(self, key)
+        if self.model_extra and key in self.model_extra:
+            return self.model_extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+class SlackAuthorization(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    enterprise_id: Optional[str] = None
+    team_id: Optional[str] = None
+    user_id: Optional[str] = None
+    is_bot: Optional[bool] = None
+    is_enterprise_install: Optional[bool] = None
 
 
 class SlackEvent(BaseModel):
     type: str
     subtype: Optional[str] = None
     event_ts: str
-    user: Optional[str] = None
-    channel: Optional[str] = None
+    # a user ID for most events, the full user object for `user_change`/`team_join`
+    user: Optional[str | Dict[str, Any]] = None
+    # a channel ID for most events, the channel object for `channel_rename`/`channel_created`
+    channel: Optional[str | Dict[str, Any]] = None
     team: Optional[str] = None
     ts: Optional[str] = None
     item: Optional[Dict[str, Any]] = None
@@ -20,6 +90,18 @@ class SlackEvent(BaseModel):
     team_id: Optional[str] = None
     bot_profile: Optional[Dict[str, Any]] = None
 
+    @property
+    def user_id(self) -> Optional[str]:
+        if isinstance(self.user, dict):
+            return self.user.get("id")
+        return self.user
+
+    @property
+    def channel_id(self) -> Optional[str]:
+        if isinstance(self.channel, dict):
+            return self.channel.get("id")
+        return self.channel
+
 
 class SlackEventPayload(BaseModel):
     token: str
@@ -27,15 +109,26 @@ class SlackEventPayload(BaseModel):
     api_app_id: Optional[str] = None
     event: Optional[SlackEvent] = None
     command: Optional[str] = None
-    actions: Optional[List[Dict[str, Any]]] = None
+    actions: Optional[List[SlackAction]] = None
     type: str
     event_id: Optional[str] = None
     event_time: Optional[int] = None
-    authorizations: Optional[List[Dict[str, Any]]] = None
+    authorizations: Optional[List[SlackAuthorization]] = None
     is_ext_shared_channel: Optional[bool] = None
     event_context: Optional[str] = None
     challenge: Optional[str] = None
 
+    @classmethod
+    async def as_json(cls, request: Request):
+        # parse the body once; the dict is kept on the request for handlers that want it
+        payload_dict = _parse_json(await request.body())
+        request.state.slack_payload = payload_dict
+        return _validate(cls, payload_dict)
+
+    @classmethod
+    async def from_request(cls, request: Request):
+        return await cls.as_json(request)
+
 
 class SlackInteractionPayload(BaseModel):
     type: str
@@ -47,15 +140,27 @@ class SlackInteractionPayload(BaseModel):
     response_url: str
     trigger_id: str
     view: Optional[Dict[str, Any]] = None
-    actions: Optional[List[Dict[str, Any]]] = None
+    actions: Optional[List[SlackAction]] = None
 
     @classmethod
     def as_form(
         cls,
+        request: Request,
         payload: Annotated[str, Form(...)],
     ):
-        payload_dict = json.loads(payload)
-        return cls(**payload_dict)
+        payload_dict = _parse_json(payload)
+        request.state.slack_payload = payload_dict
+        return _validate(cls, payload_dict)
+
+    @classmethod
+    async def from_request(cls, request: Request):
+        form = await request.form()
+        payload = form.get("payload")
+        if payload is None:
+            raise RequestValidationError(
+                [{"type": "missing", "loc": ("body", "payload"), "msg": "Field required"}]
+            )
+        return cls.as_form(request, payload)
 
 
 class SlackCommandPayload(BaseModel):
@@ -109,10 +214,18 @@ class SlackCommandPayload(BaseModel):
             api_app_id=api_app_id,
         )
 
+    @classmethod
+    async def from_request(cls, request: Request):
+        payload_dict = dict(await request.form())
+        request.state.slack_payload = payload_dict
+        return _validate(cls, payload_dict)
+
 
 SlackPayload = SlackEventPayload | SlackCommandPayload | SlackInteractionPayload
 
 __all__ = [
+    "SlackAction",
+    "SlackAuthorization",
     "SlackEvent",
     "SlackEventPayload",
     "SlackCommandPayload",
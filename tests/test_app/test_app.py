@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 
 from slackle import Slackle, SlackleConfig
+from slackle.core.plugin import SlacklePlugin
 from slackle.utils.slack import get_user_mention
 
 
@@ -49,3 +52,121 @@ def test_register_command_handler(app):
 def test_get_user_mention():
     user_id = "U12345"
     assert get_user_mention(user_id) == "<@U12345>"
+
+
+def _slack_paths(app):
+    return {route.path for route in app.routes if route.path.startswith("/slack")}
+
+
+def test_slack_interface_created_lazily(app):
+    assert "_slack" not in vars(app)
+    assert _slack_paths(app) == set()
+
+    app.on_event("message")
+
+    assert "_slack" in vars(app)
+    assert _slack_paths(app) == {"/slack/events", "/slack/command", "/slack/interactivity"}
+
+
+def test_slack_routes_attached_on_startup(app):
+    async def lifecycle():
+        await app.router.startup()
+        await app.router.shutdown()
+
+    asyncio.run(lifecycle())
+
+    assert _slack_paths(app) == {"/slack/events", "/slack/command", "/slack/interactivity"}
+
+
+def test_slack_session_shared_for_app_lifetime(app):
+    async def lifecycle():
+        await app.router.startup()
+        session = app.slack.client.session
+        assert session is not None and not session.closed
+        await app.router.shutdown()
+        return session
+
+    session = asyncio.run(lifecycle())
+
+    assert session.closed
+    assert app.slack.client.session is None
+
+
+@pytest.mark.parametrize("name", ["routes", "add_plugin", "title", "existing"])
+def test_plugin_attribute_cannot_shadow_existing_names(app, name):
+    class ShadowPlugin(SlacklePlugin):
+        def setup(self, app):
+            app.register_plugin_attribute("existing", object())
+            app.register_plugin_attribute(name, object())
+
+    with pytest.raises(AttributeError):
+        app.add_plugin(ShadowPlugin)
+
+
+def test_plugin_attribute_override(app):
+    class OverridePlugin(SlacklePlugin):
+        def setup(self, app):
+            app.register_plugin_attribute("title", "plugin title", override=True)
+
+    app.add_plugin(OverridePlugin)
+
+    assert app.title == "plugin title"
+
+
+def asgi_post(app, path, body=b"{}"):
+    """
+    Send one POST request through the ASGI app and return the response status.
+    """
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    asyncio.run(app(scope, receive, send))
+    return next(m["status"] for m in messages if m["type"] == "http.response.start")
+
+
+def test_user_routes_under_slack_prefix_still_resolve(app):
+    app.on_event("message")
+
+    @app.post("/slack/health")
+    async def health():
+        return {"ok": True}
+
+    assert asgi_post(app, "/slack/health") == 200
+    challenge = b'{"token": "verif-test", "type": "url_verification", "challenge": "c"}'
+    assert asgi_post(app, "/slack/events", challenge) == 200
+    assert asgi_post(app, "/slack/unknown") == 404
+
+
+def test_slack_routes_take_precedence_over_user_catch_all(app):
+    @app.post("/{path:path}")
+    async def catch_all(path: str):
+        return {"path": path}
+
+    async def lifecycle():
+        await app.router.startup()
+        await app.router.shutdown()
+
+    asyncio.run(lifecycle())
+
+    # an invalid event body reaches the slack endpoint (422) rather than the catch-all (200)
+    assert asgi_post(app, "/slack/events", b"{}") == 422
+    assert asgi_post(app, "/elsewhere") == 200
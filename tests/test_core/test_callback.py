@@ -0,0 +1,159 @@
+import pytest
+
+from slackle.core.slack.callback import SlackCallback
+
+
+@pytest.fixture
+def callback():
+    registry = SlackCallback()
+
+    @registry.event("message")
+    async def on_message():
+        pass
+
+    @registry.command("/say")
+    async def on_say():
+        pass
+
+    @registry.action("button-action")
+    async def on_button():
+        pass
+
+    return registry
+
+
+def test_kind_specific_getters(callback):
+    assert callback.get_event("message").__name__ == "on_message"
+    assert callback.get_command("/say").__name__ == "on_say"
+    assert callback.get_action("button-action").__name__ == "on_button"
+    assert callback.get_event("/say") is None
+
+
+def test_lookup_by_handle_type(callback):
+    assert callback.lookup("events", "message") is callback.get("events:message")
+    assert callback.lookup("command", "/say") is callback.get("command:/say")
+    assert callback.lookup("interactivity", "button-action") is callback.get(
+        "interactivity:button-action"
+    )
+    assert callback.lookup("unknown", "message") is None
+
+
+def test_merge_later_registries_win(callback):
+    other = SlackCallback()
+
+    @other.event("message")
+    async def on_other_message():
+        pass
+
+    merged = SlackCallback.merge(callback, other)
+
+    assert merged.get_event("message").__name__ == "on_other_message"
+    assert merged.lookup("command", "/say") is callback.get_command("/say")
+    assert len(merged) == 3
+
+
+def test_compound_key_views(callback):
+    assert "events:message" in callback
+    assert "events:missing" not in callback
+    assert callback["command:/say"] is callback.get_command("/say")
+    assert list(callback) == ["events:message", "command:/say", "interactivity:button-action"]
+    assert callback.callbacks == {key: callback[key] for key in callback}
+
+    with pytest.raises(KeyError):
+        callback["interactivity:missing"]
+
+
+def test_handler_parameters_precomputed():
+    registry = SlackCallback()
+
+    @registry.command("/say")
+    async def on_say(slack, text, user_id=None):
+        pass
+
+    @registry.command("/any")
+    async def on_any(slack, **kwargs):
+        pass
+
+    assert registry.lookup_entry("command", "/say").params == {"slack", "text", "user_id"}
+    assert registry.lookup_entry("command", "/any").params is None
+
+
+def test_param_getters_compiled_per_handle_type():
+    registry = SlackCallback()
+
+    @registry.event("message")
+    @registry.action("button-action")
+    async def on_either(user_id, channel_id, unknown=None):
+        pass
+
+    event_getters = registry.lookup_entry("events", "message").getters
+    action_getters = registry.lookup_entry("interactivity", "button-action").getters
+    assert [name for name, _ in event_getters] == ["user_id", "channel_id"]
+    assert [name for name, _ in action_getters] == ["user_id", "channel_id"]
+    assert event_getters[0][1] is not action_getters[0][1]
+
+
+def test_bulk_register():
+    registry = SlackCallback()
+
+    async def on_mention(user_id):
+        pass
+
+    def on_hello(text):
+        pass
+
+    registry.bulk_register(
+        [
+            ("events", "app_mention", on_mention),
+            ("command", "/hello", on_hello),
+        ]
+    )
+
+    assert registry.get_event("app_mention") is on_mention
+    assert registry.get_command("/hello") is on_hello
+    assert registry.lookup_entry("events", "app_mention").params == {"user_id"}
+
+
+def test_bulk_register_rejects_unknown_type_atomically():
+    registry = SlackCallback()
+
+    async def handler():
+        pass
+
+    with pytest.raises(ValueError):
+        registry.bulk_register([("events", "message", handler), ("shortcut", "x", handler)])
+
+    assert len(registry) == 0
+
+
+class Bot:
+    def __init__(self):
+        self.calls = []
+
+    async def on_hello(self, text):
+        self.calls.append(text)
+
+    def on_mention(self, user_id):
+        self.calls.append(user_id)
+
+
+def test_bound_methods_can_be_registered():
+    registry, bot = SlackCallback(), Bot()
+
+    registry.command("/hello")(bot.on_hello)
+    registry.bulk_register([("events", "app_mention", bot.on_mention)])
+
+    hello = registry.lookup_entry("command", "/hello")
+    assert registry.get_command("/hello") == bot.on_hello
+    assert hello.params == {"text"}
+    assert registry.lookup_entry("events", "app_mention").params == {"user_id"}
+
+
+def test_entries_follow_direct_registry_writes(callback):
+    def replacement(text):
+        pass
+
+    callback.commands["/say"] = replacement
+
+    assert callback.lookup_entry("command", "/say").func is replacement
+    assert callback.lookup_entry("command", "/missing") is None
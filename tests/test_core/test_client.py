@@ -0,0 +1,378 @@
+import asyncio
+import logging
+
+import orjson
+import pytest
+from slack_sdk.errors import SlackApiError
+
+from slackle.core.slack.client import SlackClient
+from slackle.types.response import SlackBlock, SlackMarkdown, SlackResponse
+
+
+class FakeWebClient:
+    def __init__(self):
+        self.posted = []
+        self.user_lookups = []
+        self.channel_lookups = []
+        self.channel_lists = []
+
+    async def users_info(self, user):
+        self.user_lookups.append(user)
+        await asyncio.sleep(0)
+        return {"user": {"id": user, "real_name": "Real Name", "profile": {}}}
+
+    async def channels_info(self, channel):
+        self.channel_lookups.append(channel)
+        if channel == "C_BROKEN":
+            raise RuntimeError("channel lookup failed")
+        return {"channel": {"id": channel, "name": "general"}}
+
+    async def conversations_list(self, cursor=None, **kwargs):
+        self.channel_lists.append(cursor)
+        if cursor is None:
+            return {
+                "channels": [{"id": "C1", "name": "general"}],
+                "response_metadata": {"next_cursor": "page-2"},
+            }
+        return {"channels": [{"id": "C2", "name": "alerts"}], "response_metadata": {}}
+
+    async def chat_postMessage(self, **kwargs):
+        self.posted.append(kwargs)
+        return FakeSlackResponse({"ok": True, "channel": kwargs["channel"]})
+
+
+class FakeSlackResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class RateLimitedResponse(dict):
+    def __init__(self):
+        super().__init__(ok=False, error="ratelimited")
+        self.headers = {"Retry-After": "0"}
+
+
+@pytest.fixture
+def client():
+    slack = SlackClient("xoxb-test")
+    slack.client = FakeWebClient()
+    return slack
+
+
+@pytest.fixture
+def no_throttle(monkeypatch):
+    monkeypatch.setattr("slackle.core.slack.client.BATCH_INTERVAL", 0)
+
+
+def test_send_message_batched_merges_per_channel(client):
+    async def scenario():
+        results = await asyncio.gather(
+            client.send_message_batched("first", "C1"),
+            client.send_message_batched(SlackMarkdown(text="second"), "C1"),
+            client.send_message_batched("other", "C2"),
+        )
+        await client.stop_batching()
+        return results
+
+    results = asyncio.run(scenario())
+
+    posted = {message["channel"]: message for message in client.client.posted}
+    assert len(client.client.posted) == 2
+    assert posted["C1"]["text"] == "first\nsecond"
+    assert posted["C2"]["text"] == "other"
+    assert results[0] is results[1]
+    assert client._drain_tasks == {} and client._outbox == {}
+
+
+def test_batched_text_becomes_sections_next_to_blocks(client):
+    divider = {"type": "divider"}
+
+    async def scenario():
+        await asyncio.gather(
+            client.send_message_batched("hello", "C1"),
+            client.send_message_batched(SlackBlock(blocks=[divider]), "C1"),
+        )
+
+    asyncio.run(scenario())
+
+    [message] = client.client.posted
+    assert message["blocks"] == [
+        {"type": "section", "text": {"type": "mrkdwn", "text": "hello"}},
+        divider,
+    ]
+
+
+def test_messages_queued_during_throttle_are_coalesced(client, no_throttle):
+    async def scenario():
+        first = asyncio.create_task(client.send_message_batched("first", "C1"))
+        await asyncio.sleep(0)
+        rest = [client.send_message_batched(text, "C1") for text in ("second", "third")]
+        await asyncio.gather(first, *rest)
+
+    asyncio.run(scenario())
+
+    assert [message["text"] for message in client.client.posted] == ["first", "second\nthird"]
+
+
+def test_batched_send_retries_after_rate_limit(client, no_throttle, monkeypatch):
+    post = client.client.chat_postMessage
+    failures = [SlackApiError("ratelimited", RateLimitedResponse())]
+
+    async def flaky_post(**kwargs):
+        if failures:
+            raise failures.pop()
+        return await post(**kwargs)
+
+    monkeypatch.setattr(client.client, "chat_postMessage", flaky_post)
+
+    result = asyncio.run(client.send_message_batched("hello", "C1"))
+
+    assert result == {"ok": True, "channel": "C1"}
+    assert len(client.client.posted) == 1
+
+
+def test_user_info_cached_until_invalidated(client):
+    async def scenario():
+        name = await client.get_user_name("U1")
+        info = await client.get_user_info("U1")
+        client.invalidate_user("U1")
+        await client.get_user_info("U1")
+        return name, info
+
+    name, info = asyncio.run(scenario())
+
+    assert name == "Real Name"
+    assert info["id"] == "U1"
+    assert client.client.user_lookups == ["U1", "U1"]
+
+
+@pytest.mark.parametrize(
+    "payload, expected",
+    [
+        (b'{"text": "static"}', {"channel": "C1", "text": "static"}),
+        (b"{}", {"channel": "C1"}),
+    ],
+)
+def test_send_message_raw_splices_channel(client, monkeypatch, payload, expected):
+    sent = []
+
+    async def fake_post_json(api_method, body):
+        sent.append((api_method, orjson.loads(body)))
+        return {"ok": True}
+
+    monkeypatch.setattr(client, "_post_json", fake_post_json)
+
+    assert asyncio.run(client.send_message_raw(payload, "C1")) == {"ok": True}
+    assert sent == [("chat.postMessage", expected)]
+
+
+def test_clients_share_one_session():
+    async def scenario():
+        first, second = SlackClient("xoxb-first"), SlackClient("xoxb-second")
+        await first.open_session()
+        await second.open_session()
+        session = second.client.session
+        shared = first.client.session is session
+        await first.close_session()
+        open_after_first = not session.closed
+        await second.close_session()
+        return shared, open_after_first, session.closed
+
+    assert asyncio.run(scenario()) == (True, True, True)
+
+
+def test_session_from_earlier_loop_is_closed():
+    first, second = SlackClient("xoxb-first"), SlackClient("xoxb-second")
+
+    async def attach(client):
+        await client.open_session()
+        return client.client.session
+
+    stale = asyncio.run(attach(first))
+
+    async def scenario():
+        fresh = await attach(second)
+        await second.close_session()
+        return fresh
+
+    fresh = asyncio.run(scenario())
+
+    assert stale.closed
+    assert fresh is not stale and fresh.closed
+
+
+def test_concurrent_user_lookups_share_one_request(client):
+    async def scenario():
+        return await asyncio.gather(*(client.get_user_info("U1") for _ in range(5)))
+
+    results = asyncio.run(scenario())
+
+    assert client.client.user_lookups == ["U1"]
+    assert all(result is results[0] for result in results)
+
+
+def test_channel_info_cached_until_invalidated(client):
+    async def scenario():
+        name = await client.get_channel_name("C1")
+        await client.get_channel_info("C1")
+        client.invalidate_channel("C1")
+        await client.get_channel_info("C1")
+        return name
+
+    assert asyncio.run(scenario()) == "general"
+    assert client.client.channel_lookups == ["C1", "C1"]
+
+
+def test_failed_lookup_not_cached(client):
+    async def scenario():
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await client.get_channel_info("C_BROKEN")
+
+    asyncio.run(scenario())
+
+    assert client.client.channel_lookups == ["C_BROKEN", "C_BROKEN"]
+
+
+class ThreadedReply(SlackResponse):
+    pass
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("hi", SlackResponse(channel="C1", text="hi")),
+        (SlackMarkdown(text="*hi*"), SlackResponse(channel="C1", text="*hi*")),
+        (
+            SlackBlock(blocks=[{"type": "divider"}]),
+            SlackResponse(channel="C1", blocks=[{"type": "divider"}]),
+        ),
+    ],
+)
+def test_normalize_response(client, message, expected):
+    assert client._normalize_response(message, "C1") == expected
+
+
+def test_normalize_response_passes_responses_and_subclasses_through(client):
+    response, reply = SlackResponse(text="hi"), ThreadedReply(text="hi", thread_ts="1.0")
+
+    assert client._normalize_response(response, "C1") is response
+    assert client._normalize_response(reply, "C1") is reply
+
+
+def test_send_message_forwards_only_set_fields(client):
+    asyncio.run(client.send_message(SlackResponse(text="hi", thread_ts="1.0"), "C1"))
+
+    assert client.client.posted == [
+        {"channel": "C1", "text": "hi", "thread_ts": "1.0", "mrkdwn": True}
+    ]
+
+
+def test_concurrent_requests_are_capped(monkeypatch):
+    monkeypatch.setenv("SLACK_MAX_CONCURRENT_REQUESTS", "2")
+    client = SlackClient("xoxb-test")
+    client.client = FakeWebClient()
+    active, peak = 0, 0
+
+    async def slow_post(**kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return FakeSlackResponse({"ok": True})
+
+    monkeypatch.setattr(client.client, "chat_postMessage", slow_post)
+
+    async def scenario():
+        await asyncio.gather(*(client.send_message("hi", "C1") for _ in range(5)))
+
+    # a fresh loop per run, as with separate app lifecycles
+    asyncio.run(scenario())
+    asyncio.run(scenario())
+
+    assert peak == 2
+
+
+def test_send_message_logs_api_errors(client, monkeypatch, caplog):
+    async def failing_post(**kwargs):
+        raise SlackApiError("channel_not_found", {"ok": False, "error": "channel_not_found"})
+
+    monkeypatch.setattr(client.client, "chat_postMessage", failing_post)
+
+    with caplog.at_level(logging.ERROR, logger="slackle.core.slack.client"):
+        assert asyncio.run(client.send_message("hi", "C1")) is None
+
+    assert "Error sending message to C1" in caplog.text
+
+
+def test_block_only_message_gets_text_fallback(client):
+    blocks = [{"type": "divider"}]
+
+    asyncio.run(client.send_message(SlackBlock(blocks=blocks), "C1"))
+
+    [message] = client.client.posted
+    assert message["blocks"] == blocks
+    assert message["text"] == str(blocks)
+
+
+def test_empty_message_rejected(client):
+    with pytest.raises(ValueError):
+        asyncio.run(client.send_message(SlackResponse(), "C1"))
+
+
+def test_resolve_channel_pages_once_and_caches_names(client):
+    async def scenario():
+        return [
+            await client.resolve_channel("#alerts"),
+            await client.resolve_channel("alerts"),
+            await client.resolve_channel("general"),
+            await client.resolve_channel("C0123ABCD"),
+        ]
+
+    assert asyncio.run(scenario()) == ["C2", "C2", "C1", "C0123ABCD"]
+    assert client.client.channel_lists == [None, "page-2"]
+
+
+def test_resolve_unknown_channel_and_invalidate_renamed(client):
+    async def scenario():
+        with pytest.raises(ValueError):
+            await client.resolve_channel("#missing")
+        client.invalidate_channel("C2")
+        return "alerts" in client._channel_ids, "general" in client._channel_ids
+
+    assert asyncio.run(scenario()) == (False, True)
+
+
+def test_batched_messages_with_different_options_not_merged(client):
+    async def scenario():
+        await asyncio.gather(
+            client.send_message_batched(SlackResponse(text="a", username="bot-a"), "C1"),
+            client.send_message_batched(SlackResponse(text="b", username="bot-a"), "C1"),
+            client.send_message_batched(
+                SlackResponse(text="c", username="bot-b", unfurl_links=False), "C1"
+            ),
+        )
+
+    asyncio.run(scenario())
+
+    assert [(m["text"], m["username"]) for m in client.client.posted] == [
+        ("a\nb", "bot-a"),
+        ("c", "bot-b"),
+    ]
+    assert client.client.posted[1]["unfurl_links"] is False
+
+
+def test_long_text_not_merged_into_sections(client):
+    long_text = "x" * 3001
+
+    async def scenario():
+        await asyncio.gather(
+            client.send_message_batched(SlackBlock(blocks=[{"type": "divider"}]), "C1"),
+            client.send_message_batched(long_text, "C1"),
+        )
+
+    asyncio.run(scenario())
+
+    assert len(client.client.posted) == 2
+    assert client.client.posted[1]["text"] == long_text
@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from slackle import Slackle, SlackleConfig
+from slackle.core.plugin import SlacklePlugin, on_slackle_event
+
+
+class RecorderPlugin(SlacklePlugin):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    @on_slackle_event("startup")
+    async def on_startup(self, app):
+        self.calls.append(("startup", app))
+
+    @on_slackle_event("slack.error")
+    def on_error(self, app, error):
+        self.calls.append(("slack.error", error))
+
+
+@pytest.fixture
+def app():
+    return Slackle(config=SlackleConfig(app_token="xapp-test"))
+
+
+def test_hook_index_built_on_add_plugin(app):
+    app.add_plugin(RecorderPlugin)
+
+    assert [is_coro for _, is_coro in app._hook_index["startup"]] == [True]
+    assert [is_coro for _, is_coro in app._hook_index["slack.error"]] == [False]
+
+
+def test_emit_calls_sync_and_async_hooks(app):
+    app.add_plugin(RecorderPlugin)
+    plugin = app._plugins[0]
+    error = ValueError("boom")
+
+    asyncio.run(app.hooks.emit(app, "startup"))
+    asyncio.run(app.hooks.emit(app, "slack.error", error=error))
+
+    assert plugin.calls == [("startup", app), ("slack.error", error)]
+
+
+def test_emit_without_listeners_is_noop(app):
+    app.add_plugin(RecorderPlugin)
+
+    asyncio.run(app.hooks.emit(app, "shutdown"))
+
+    assert app._plugins[0].calls == []
+
+
+def test_emit_does_not_grow_index_for_unknown_hooks(app):
+    asyncio.run(app.hooks.emit(app, "slack.unhandled"))
+
+    assert "slack.unhandled" not in app._hook_index
+
+
+def test_has_reports_registered_listeners(app):
+    assert not app.hooks.has("startup")
+
+    app.add_plugin(RecorderPlugin)
+
+    assert app.hooks.has("startup")
+    assert not app.hooks.has("shutdown")
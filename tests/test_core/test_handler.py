@@ -0,0 +1,247 @@
+import asyncio
+
+import pytest
+from fastapi import BackgroundTasks, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+
+from slackle import Slackle, SlackleConfig
+from slackle.constants import SlackVerificationMode
+from slackle.core.slack.handler import SlackPayloadHandler
+from slackle.types.payload import SlackCommandPayload, SlackInteractionPayload
+
+
+@pytest.fixture
+def app():
+    return Slackle(config=SlackleConfig(app_token="xapp-test", verification_token="token"))
+
+
+@pytest.fixture
+def payload():
+    return SlackCommandPayload(
+        token="token",
+        channel_id="C1",
+        user_id="U1",
+        command="/say",
+        text="hello",
+        response_url="https://hooks.slack.test",
+    )
+
+
+def handle(app, handler, payload):
+    request = Request({"type": "http", "headers": []})
+    return asyncio.run(handler._handle("command", "/say", app, request, Response(), payload))
+
+
+def test_handler_receives_only_declared_params(app, payload):
+    handler = SlackPayloadHandler()
+    calls = []
+
+    @handler.callbacks.command("/say")
+    async def say(text, user_id):
+        calls.append((text, user_id))
+
+    handle(app, handler, payload)
+
+    assert calls == [("hello", "U1")]
+
+
+def test_handler_added_without_decorator_is_prepared_on_dispatch(app, payload):
+    handler = SlackPayloadHandler()
+    calls = []
+
+    def say(channel_id):
+        calls.append(channel_id)
+
+    handler.callbacks.commands["/say"] = say
+    handle(app, handler, payload)
+
+    assert calls == ["C1"]
+    assert handler.callbacks.lookup_entry("command", "/say").params == {"channel_id"}
+
+
+def test_undeclared_params_are_not_resolved(app, payload):
+    handler = SlackPayloadHandler()
+
+    @handler.callbacks.command("/say")
+    def say(text):
+        pass
+
+    handle(app, handler, payload)
+
+    # `slack` was never requested, so the lazy slack interface stays unbuilt
+    assert "_slack" not in app.__dict__
+
+
+@pytest.mark.parametrize(
+    "actions, expected",
+    [([{"action_id": "approve"}], "approve"), ([{}], "unknown_action"), (None, "unknown_action")],
+)
+def test_extract_interaction_handle_name(actions, expected):
+    payload = SlackInteractionPayload(
+        type="block_actions",
+        token="token",
+        response_url="https://hooks.slack.test",
+        trigger_id="T1",
+        actions=actions,
+    )
+
+    assert SlackPayloadHandler()._extract_handle_name("interactivity", payload) == expected
+
+
+def form_request(body: bytes) -> Request:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    headers = [(b"content-type", b"application/x-www-form-urlencoded")]
+    return Request({"type": "http", "method": "POST", "headers": headers}, receive)
+
+
+def test_shared_endpoint_parses_payload_for_handle_type(app):
+    handler = SlackPayloadHandler()
+    body = b"token=token&command=%2Fsay&text=hi&response_url=https%3A%2F%2Fhooks.slack.test"
+    background_tasks = BackgroundTasks()
+
+    response = asyncio.run(
+        handler._payload_handler("command", form_request(body), Response(), background_tasks, app)
+    )
+
+    [task] = background_tasks.tasks
+    assert response.status_code == 200
+    assert task.args[:2] == ("command", "/say")
+    assert task.args[-1].text == "hi"
+
+
+def test_shared_endpoint_rejects_unknown_handle_type(app):
+    handler = SlackPayloadHandler()
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(handler._payload_handler("unknown", form_request(b""), Response(), None, app))
+
+    assert exc_info.value.status_code == 404
+
+
+def test_interaction_form_without_payload_is_rejected(app):
+    handler = SlackPayloadHandler()
+
+    with pytest.raises(RequestValidationError):
+        asyncio.run(
+            handler._payload_handler(
+                "interactivity", form_request(b""), Response(), BackgroundTasks(), app
+            )
+        )
+
+
+def command_body(text: str) -> bytes:
+    return (
+        b"token=token&command=%2Fsay&text="
+        + text.encode()
+        + b"&response_url=https%3A%2F%2Fhooks.slack.test"
+    )
+
+
+def test_workers_run_queued_handlers(app):
+    handler = SlackPayloadHandler()
+    calls = []
+
+    @handler.callbacks.command("/say")
+    async def say(text):
+        calls.append(text)
+
+    async def scenario():
+        handler.start_workers(count=2, queue_size=10)
+        for text in ("one", "two"):
+            await handler._payload_handler(
+                "command", form_request(command_body(text)), Response(), BackgroundTasks(), app
+            )
+        await handler.stop_workers()
+
+    asyncio.run(scenario())
+
+    assert sorted(calls) == ["one", "two"]
+    assert handler._workers == []
+
+
+def test_full_work_queue_sheds_load(app):
+    handler = SlackPayloadHandler()
+
+    async def scenario():
+        handler.start_workers(count=1, queue_size=1)
+        statuses = [
+            (
+                await handler._payload_handler(
+                    "command", form_request(command_body("hi")), Response(), BackgroundTasks(), app
+                )
+            ).status_code
+            for _ in range(2)
+        ]
+        await handler.stop_workers()
+        return statuses
+
+    assert asyncio.run(scenario()) == [200, 503]
+
+
+def test_signature_mode_rejects_unsigned_requests():
+    config = SlackleConfig(verification_mode=SlackVerificationMode.SIGNATURE, signing_secret="s")
+    app = Slackle(config=config)
+
+    response = asyncio.run(
+        SlackPayloadHandler()._payload_handler(
+            "command", form_request(command_body("hi")), Response(), BackgroundTasks(), app
+        )
+    )
+
+    assert response.status_code == 401
+
+
+def test_each_request_gets_a_fresh_context(app, payload):
+    handler = SlackPayloadHandler()
+    seen = []
+
+    @handler.callbacks.command("/say")
+    def say(context):
+        context.seen = True
+        seen.append(context)
+
+    handle(app, handler, payload)
+    handle(app, handler, payload)
+
+    assert seen[0] is not seen[1]
+    assert seen[0].seen and seen[1].seen
+
+
+def test_bound_method_handler_dispatched(app, payload):
+    class Bot:
+        def __init__(self):
+            self.calls = []
+
+        async def say(self, text, user_id):
+            self.calls.append((text, user_id))
+
+    handler, bot = SlackPayloadHandler(), Bot()
+    handler.callbacks.command("/say")(bot.say)
+
+    handle(app, handler, payload)
+
+    assert bot.calls == [("hello", "U1")]
+
+
+def test_sync_wrapper_returning_coroutine_is_awaited(app, payload):
+    handler = SlackPayloadHandler()
+    calls = []
+
+    class CallableHandler:
+        async def __call__(self, user_id):
+            calls.append(("callable", user_id))
+
+    async def real(text):
+        calls.append(("wrapped", text))
+
+    def wrapper(text):
+        return real(text)
+
+    handler.callbacks.command("/say")(wrapper)
+    handle(app, handler, payload)
+    handler.callbacks.command("/say")(CallableHandler())
+    handle(app, handler, payload)
+
+    assert calls == [("wrapped", "hello"), ("callable", "U1")]
@@ -0,0 +1,62 @@
+import asyncio
+
+from slackle.core.plugin import SlacklePlugin, on_slackle_event
+
+
+class BasePlugin(SlacklePlugin):
+    @on_slackle_event("startup")
+    def on_startup(self, app):
+        pass
+
+    @on_slackle_event("shutdown")
+    def on_shutdown(self, app):
+        pass
+
+
+class ChildPlugin(BasePlugin):
+    def on_shutdown(self, app):
+        pass
+
+    @property
+    def expensive(self):
+        raise AssertionError("properties must not be evaluated during hook collection")
+
+
+def test_hook_names_collected_per_class():
+    assert BasePlugin._event_hook_names == {
+        "startup": ("on_startup",),
+        "shutdown": ("on_shutdown",),
+    }
+
+
+def test_override_without_decorator_shadows_parent_hook():
+    assert ChildPlugin._event_hook_names == {"startup": ("on_startup",)}
+
+
+def test_hooks_bound_to_instance():
+    plugin = ChildPlugin()
+
+    assert plugin._event_hooks["startup"] == (plugin.on_startup,)
+    assert plugin._event_hooks["startup"][0].__self__ is plugin
+
+
+def test_dispatch_calls_bound_hooks_with_app():
+    class DispatchPlugin(SlacklePlugin):
+        def __init__(self):
+            super().__init__()
+            self.calls = []
+
+        @on_slackle_event("startup")
+        async def on_startup(self, app, **kwargs):
+            self.calls.append((app, kwargs))
+
+        @on_slackle_event("startup")
+        def on_startup_sync(self, app, **kwargs):
+            self.calls.append((app, kwargs))
+
+    plugin = DispatchPlugin()
+    app = object()
+
+    asyncio.run(plugin.dispatch(app, "startup", reason="test"))
+
+    assert plugin.calls == [(app, {"reason": "test"}), (app, {"reason": "test"})]
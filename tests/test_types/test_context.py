@@ -0,0 +1,28 @@
+import pytest
+
+from slackle.types.context import SlackleContext
+
+
+def test_context_has_no_instance_dict():
+    assert not hasattr(SlackleContext(), "__dict__")
+
+
+def test_skip_state_kept_out_of_user_values():
+    context = SlackleContext(user="U1")
+
+    context.skip("Ignoring bot events")
+
+    assert context.is_skipped
+    assert context.skip_reason == "Ignoring bot events"
+    assert list(context) == ["user"]
+
+
+def test_attribute_access_reads_and_writes_user_values():
+    context = SlackleContext()
+
+    context.retries = 2
+    assert context.retries == 2 and context.get("retries") == 2
+
+    del context.retries
+    with pytest.raises(AttributeError):
+        context.retries
@@ -0,0 +1,85 @@
+import asyncio
+
+import orjson
+import pytest
+from fastapi.exceptions import RequestValidationError
+from starlette.requests import Request
+
+from slackle.types.payload import SlackAction, SlackEventPayload, SlackInteractionPayload
+
+
+def make_request(body: bytes) -> Request:
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return Request({"type": "http", "method": "POST", "headers": []}, receive)
+
+
+def test_event_payload_parsed_once_and_stashed():
+    data = {
+        "token": "verif-test",
+        "type": "event_callback",
+        "event": {"type": "message", "event_ts": "1.0", "user": "U1", "channel": "C1"},
+    }
+    request = make_request(orjson.dumps(data))
+
+    payload = asyncio.run(SlackEventPayload.as_json(request))
+
+    assert payload.event.user == "U1"
+    assert request.state.slack_payload == data
+
+
+def test_event_payload_invalid_json():
+    with pytest.raises(RequestValidationError) as exc_info:
+        asyncio.run(SlackEventPayload.as_json(make_request(b"{not json")))
+
+    assert exc_info.value.errors()[0]["type"] == "json_invalid"
+
+
+def test_event_payload_validation_error_located_in_body():
+    with pytest.raises(RequestValidationError) as exc_info:
+        asyncio.run(SlackEventPayload.as_json(make_request(b'{"type": "event_callback"}')))
+
+    assert exc_info.value.errors()[0]["loc"] == ("body", "token")
+
+
+def test_interaction_actions_are_typed_and_keep_extra_fields():
+    payload = SlackInteractionPayload.model_validate(
+        {
+            "type": "block_actions",
+            "token": "verif-test",
+            "response_url": "https://hooks.slack.test",
+            "trigger_id": "T1",
+            "actions": [
+                {"action_id": "pick", "type": "static_select", "selected_option": {"value": "a"}}
+            ],
+        }
+    )
+
+    [action] = payload.actions
+    assert isinstance(action, SlackAction)
+    assert action.action_id == "pick"
+    assert action.selected_option == {"value": "a"}
+    assert action.get("selected_option") == {"value": "a"}
+    assert action.get("value", "missing") is None
+    assert action["action_id"] == "pick"
+    assert action["selected_option"] == {"value": "a"}
+    assert action.get("json", "missing") == "missing"
+    with pytest.raises(KeyError):
+        action["copy"]
+
+
+def test_event_channel_id_from_channel_object():
+    payload = SlackEventPayload.model_validate(
+        {
+            "token": "verif-test",
+            "type": "event_callback",
+            "event": {
+                "type": "channel_rename",
+                "event_ts": "1.0",
+                "channel": {"id": "C1", "name": "renamed", "created": 1360782804},
+            },
+        }
+    )
+
+    assert payload.event.channel_id == "C1"
@@ -0,0 +1,52 @@
+import pytest
+
+from slackle.utils import cache as cache_module
+from slackle.utils.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_and_set():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache["a"] = 1
+
+    assert cache["a"] == 1
+    assert "a" in cache
+    assert cache.get("b") is None
+    with pytest.raises(KeyError):
+        cache["b"]
+
+
+def test_least_recently_used_entry_evicted():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")
+    cache["c"] = 3
+
+    assert list(cache) == ["a", "c"]
+
+
+def test_entries_expire(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache["a"] = 1
+
+    clock[0] = 9.9
+    assert cache.get("a") == 1
+
+    clock[0] = 10.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_pop():
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache["a"] = 1
+
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "missing") == "missing"
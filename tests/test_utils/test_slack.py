@@ -0,0 +1,34 @@
+import hashlib
+import hmac
+
+import pytest
+
+from slackle.utils.slack import verify_slack_signature
+
+SECRET = "8f742231b10e8888abcd99yyyzzz85a5"
+BODY = b"token=xyzz0WbapA4vBCDEFasx0q6G&command=%2Fsay&text=hi"
+
+
+def sign(timestamp: str, body: bytes = BODY) -> str:
+    basestring = b"v0:" + timestamp.encode() + b":" + body
+    return "v0=" + hmac.new(SECRET.encode(), basestring, hashlib.sha256).hexdigest()
+
+
+def test_valid_signature():
+    assert verify_slack_signature(BODY, "1531420618", sign("1531420618"), SECRET, now=1531420618)
+
+
+@pytest.mark.parametrize(
+    "timestamp, signature, now",
+    [
+        ("1531420618", sign("1531420618", b"tampered"), 1531420618),
+        ("1531420618", sign("1531420618"), 1531420618 + 301),
+        ("not-a-number", sign("not-a-number"), 1531420618),
+        (None, sign("1531420618"), 1531420618),
+        ("1531420618", None, 1531420618),
+        ("1531420618", "v0=\xe9", 1531420618),
+        ("1531420618", "v0=\u20ac", 1531420618),
+    ],
+)
+def test_invalid_signature(timestamp, signature, now):
+    assert not verify_slack_signature(BODY, timestamp, signature, SECRET, now=now)